@@ -69,7 +69,8 @@ class SetupWizard(SplitFluentWindow):
         self.setWindowTitle("林浅月 | Lunar - 设置向导")
         self.setWindowIcon(QIcon(os.path.abspath('.//wizardWindows/Icon_rounded.png')))
         self.resize(1000, 700)
-        
+        self.setStyleSheet(self.styleSheet() + TRANSPARENT_QSS)
+
         # 1. 创建启动页面
         self.splashScreen = SplashScreen(self.windowIcon(), self)
         self.splashScreen.setIconSize(QSize(128, 128))
@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QApplication, QWidget, QDialog, QMessageBox, QHBoxLayout, QSpacerItem, QSizePolicy, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import QDesktopServices, QPalette, QColor
 from qfluentwidgets import (SplitFluentWindow, FluentIcon, 
                             NavigationItemPosition, CardWidget, LineEdit, PrimaryPushButton, PushButton, SubtitleLabel, 
                             FluentTranslator, Theme, setTheme, setThemeColor, isDarkTheme, 
@@ -18,126 +19,119 @@ from wizardWindows.Ui_JianerSetupOthers import Ui_Form as Ui_JianerSetupOthers
 from wizardWindows.Ui_JianerSetupTTS import Ui_Form as Ui_JianerSetupTTS
 from wizardWindows.Ui_JianerSetupPlugins import Ui_Form as Ui_JianerSetupPlugins
 from wizardWindows.Ui_JianerSetupPluginWindow import Ui_Form as Ui_JianerSetupPluginWindow
-import webbrowser, os
 
-class JianerSetupWizard(QWidget, Ui_JianerSetupWizard):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupPre(QWidget, Ui_JianerSetupPre):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.ScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupLgr(QWidget, Ui_JianerSetupLgr):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupBasic(QWidget, Ui_JianerSetupBasic):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupApply(QWidget, Ui_JianerSetupApply):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupAI(QWidget, Ui_JianerSetupAI):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.IconWidget_8.setIcon(FluentIcon.MESSAGE)
-        
-class JianerSetupAdvanced(QWidget, Ui_JianerSetupAdvanced):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupWizard(QWidget, Ui_JianerSetupWizard):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupAbout(QWidget, Ui_JianerSetupAbout):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        
-class JianerSetupWizard(QWidget, Ui_JianerSetupWizard):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        self.IconWidget_2.setIcon(FluentIcon.TRANSPARENT)
-        self.IconWidget.setIcon(FluentIcon.ALIGNMENT)
-        self.IconWidget_3.setIcon(FluentIcon.DEVELOPER_TOOLS)
-        self.IconWidget_4.setIcon(FluentIcon.PENCIL_INK)
-        self.IconWidget_5.setIcon(FluentIcon.APPLICATION)
-        self.IconWidget_6.setIcon(FluentIcon.CODE)
-        self.IconWidget_7.setIcon(FluentIcon.CAFE)
-
-class JianerSetupOthers(QWidget, Ui_JianerSetupOthers):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        self.IconWidget_8.setIcon(FluentIcon.CALORIES)
-        self.IconWidget_2.setIcon(FluentIcon.TAG)
-        self.IconWidget_9.setIcon(FluentIcon.DOWN)
-        self.PokeWords.setPlainText("\n".join([
-      "不要捣蛋"
-    ]))
-        self.NiceWords.setPlainText("\n".join([
-      "感谢你的鼓励，可以给我主页点个赞吗"
-    ]))
-
-class JianerSetupTTS(QWidget, Ui_JianerSetupTTS):
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        self.setupUi(self)
-        self.SmoothScrollArea.setStyleSheet("background: transparent;")
-        self.IconWidget_3.setIcon(FluentIcon.LANGUAGE)
-        self.IconWidget_2.setIcon(FluentIcon.SPEED_OFF)
-        self.IconWidget_4.setIcon(FluentIcon.VOLUME)
-        self.IconWidget_5.setIcon(FluentIcon.SCROLL)
-        
-class JianerSetupPlugins(QWidget, Ui_JianerSetupPlugins):
+# 透明背景规则，由主窗口统一设置一次，页面只需给控件打上 transparentBg 属性
+# 同时作用于该控件的所有子控件（视口、scrollAreaWidgetContents 等），与原先无选择器的样式表一致
+TRANSPARENT_QSS = ('QWidget[transparentBg="true"], QWidget[transparentBg="true"] QWidget '
+                   '{ background: transparent; }')
+
+class JianerSetupPage(QWidget):
+    """向导页面基类：setupUi 后统一打上透明背景标记、设置图标"""
+    _ICONS = ()  # ((控件名, FluentIcon), ...)
+    _SCROLL_AREA = "SmoothScrollArea"  # 需要透明背景的滚动区域，没有则为 None
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setupUi(self)
-        self.ScrollArea.setStyleSheet("background: transparent;")
-        
+        # 间隔项已归布局所有且无人访问，不保留其 Python 引用，减小每个页面的 __dict__
+        for name in [k for k, v in self.__dict__.items() if isinstance(v, QSpacerItem)]:
+            del self.__dict__[name]
+        if self._SCROLL_AREA:
+            getattr(self, self._SCROLL_AREA).setProperty("transparentBg", True)
+        for name, fi in self._ICONS:
+            getattr(self, name).setIcon(fi)
+        self._init_page()
+
+    def _init_page(self):
+        """setupUi 之后的页面初始化（默认文本等），由子类覆盖"""
+        pass
+
+class JianerSetupPre(JianerSetupPage, Ui_JianerSetupPre):
+    _SCROLL_AREA = "ScrollArea"
+
+class JianerSetupLgr(JianerSetupPage, Ui_JianerSetupLgr):
+    pass
+
+class JianerSetupBasic(JianerSetupPage, Ui_JianerSetupBasic):
+    pass
+
+class JianerSetupApply(JianerSetupPage, Ui_JianerSetupApply):
+    pass
+
+class JianerSetupAI(JianerSetupPage, Ui_JianerSetupAI):
+    _SCROLL_AREA = None
+    _ICONS = (
+        ("IconWidget_8", FluentIcon.MESSAGE),
+    )
+
+class JianerSetupAdvanced(JianerSetupPage, Ui_JianerSetupAdvanced):
+    pass
+
+class JianerSetupAbout(JianerSetupPage, Ui_JianerSetupAbout):
+    pass
+
+class JianerSetupWizard(JianerSetupPage, Ui_JianerSetupWizard):
+    _ICONS = (
+        ("IconWidget_2", FluentIcon.TRANSPARENT),
+        ("IconWidget", FluentIcon.ALIGNMENT),
+        ("IconWidget_3", FluentIcon.DEVELOPER_TOOLS),
+        ("IconWidget_4", FluentIcon.PENCIL_INK),
+        ("IconWidget_5", FluentIcon.APPLICATION),
+        ("IconWidget_6", FluentIcon.CODE),
+        ("IconWidget_7", FluentIcon.CAFE),
+    )
+
+class JianerSetupOthers(JianerSetupPage, Ui_JianerSetupOthers):
+    _ICONS = (
+        ("IconWidget_8", FluentIcon.CALORIES),
+        ("IconWidget_2", FluentIcon.TAG),
+        ("IconWidget_9", FluentIcon.DOWN),
+    )
+
+    def _init_page(self):
+        self.PokeWords.setPlainText("不要捣蛋")
+        self.NiceWords.setPlainText("感谢你的鼓励，可以给我主页点个赞吗")
+
+class JianerSetupTTS(JianerSetupPage, Ui_JianerSetupTTS):
+    _ICONS = (
+        ("IconWidget_3", FluentIcon.LANGUAGE),
+        ("IconWidget_2", FluentIcon.SPEED_OFF),
+        ("IconWidget_4", FluentIcon.VOLUME),
+        ("IconWidget_5", FluentIcon.SCROLL),
+    )
+
+class JianerSetupPlugins(JianerSetupPage, Ui_JianerSetupPlugins):
+    _SCROLL_AREA = "ScrollArea"
+
 class JianerSetupPluginWindow(QDialog, Ui_JianerSetupPluginWindow):
+    _connected = False  # 信号只连接一次，避免复用对话框时重复触发
+
     def __init__(self, parent=None, is_dark_mode=False, is_all=True):
         super().__init__()
         self.setupUi(self)
-        self.ScrollArea.setContentsMargins(0, 0, self.ScrollArea.contentsMargins().right(), self.ScrollArea.contentsMargins().bottom())
-        self.ScrollArea_2.setContentsMargins(0, 0, self.ScrollArea_2.contentsMargins().right(), self.ScrollArea_2.contentsMargins().bottom())
-        self.ScrollArea_3.setContentsMargins(0, 0, self.ScrollArea_3.contentsMargins().right(), self.ScrollArea_3.contentsMargins().bottom())
-        
-        self.DependPageText.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.IntroPageText.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.LicencePageText.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.DependPageText.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.IntroPageText.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.LicencePageText.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # 批量调整边距和滚动条，期间暂停重绘，只触发一次重新布局
+        self.setUpdatesEnabled(False)
+        try:
+            for scrollArea in (self.ScrollArea, self.ScrollArea_2, self.ScrollArea_3):
+                margins = scrollArea.contentsMargins()
+                scrollArea.setContentsMargins(0, 0, margins.right(), margins.bottom())
+            for textEdit in (self.DependPageText, self.IntroPageText, self.LicencePageText):
+                textEdit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+                textEdit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        finally:
+            self.setUpdatesEnabled(True)
         # self.IntroPageText.setStyleSheet("background: transparent;")
         if is_dark_mode:
-            self.setStyleSheet("background-color: rgb(50, 50, 50);")
-            self.IntroPageText.setStyleSheet("color: rgb(255, 255, 255);")
-            self.DependPageText.setStyleSheet("color: rgb(255, 255, 255);")
-            self.LicencePageText.setStyleSheet("color: rgb(255, 255, 255);")
+            # 用调色板代替样式表，避免逐个控件解析 QSS
+            pal = self.palette()
+            pal.setColor(QPalette.Window, QColor(50, 50, 50))
+            pal.setColor(QPalette.Base, QColor(50, 50, 50))
+            self.setPalette(pal)
+            self.setAutoFillBackground(True)
+            for textEdit in (self.IntroPageText, self.DependPageText, self.LicencePageText):
+                p = textEdit.palette()
+                p.setColor(QPalette.Text, Qt.white)
+                textEdit.setPalette(p)
 
         if is_all:
             pass
@@ -148,17 +142,22 @@ class JianerSetupPluginWindow(QDialog, Ui_JianerSetupPluginWindow):
                       licence: str = "没有相关协议 (LICENSE)"):
         
         self.LargeTitleLabel.setText(" " + title)
-        self.IntroPageText.setMarkdown(intro)
-        self.DependPageText.setText(f'''该插件要求以下依赖库：
-{os.linesep.join("    " + line for line in depend.splitlines() if line.strip())}'''
-if not "没有相关依赖" in depend else depend)
-        
-        self.LicencePageText.setText(licence)
-        
-        self.ManageButton_2.clicked.connect(self.close)
-        self.AblitilyButton_2.clicked.connect(
-            lambda: webbrowser.open(f"https://github.com/IntelliMarkets/Jianer_Plugins_Index/tree/main/{title}")
-        )
+        self.setDocumentText(self.IntroPageText, intro, markdown=True)
+        if "没有相关依赖" in depend:
+            depend_text = depend
+        else:
+            lines = [f"    {line}" for line in depend.splitlines() if line.strip()]
+            depend_text = "该插件要求以下依赖库：\n" + "\n".join(lines)
+        self.setDocumentText(self.DependPageText, depend_text)
+        self.setDocumentText(self.LicencePageText, licence)
+        
+        self._pages = {w.objectName(): w for w in (self.IntroPage, self.DependPage, self.LicencePage)}
+        self._url = QUrl(f"https://github.com/IntelliMarkets/Jianer_Plugins_Index/tree/main/{title}")
+        if not self._connected:
+            self.ManageButton_2.clicked.connect(self.close)
+            self.AblitilyButton_2.clicked.connect(self._open_page)
+            self.SegmentedWidget.currentItemChanged.connect(self._switchPage)
+            self._connected = True
         self.AblitilyButton_2.setText("打开页面")
         self.ManageButton_2.setText("好")
         
@@ -168,11 +167,26 @@ if not "没有相关依赖" in depend else depend)
         self.OpacityAniStackedWidget.setCurrentIndex(0)
         self.SegmentedWidget.setCurrentItem(self.IntroPage.objectName())
 
-        self.SegmentedWidget.currentItemChanged.connect(
-            lambda k:  self.OpacityAniStackedWidget.setCurrentWidget(self.OpacityAniStackedWidget.findChild(QWidget, k)))
+    def _switchPage(self, routeKey: str):
+        self.OpacityAniStackedWidget.setCurrentWidget(self._pages[routeKey])
+
+    def _open_page(self):
+        QDesktopServices.openUrl(self._url)
+
+    def setDocumentText(self, textEdit, text: str, markdown: bool = False):
+        """直接写入文本框内部的 QTextDocument，期间暂停重绘并关闭撤销记录"""
+        doc = textEdit.document()
+        doc.setUndoRedoEnabled(False)
+        textEdit.setUpdatesEnabled(False)
+        try:
+            if markdown:
+                doc.setMarkdown(text)
+            else:
+                doc.setPlainText(text)
+        finally:
+            textEdit.setUpdatesEnabled(True)
 
-        
     def addSubInterface(self, widget: QWidget, objectName, text):
+        # 页面已由 setupUi 加入 OpacityAniStackedWidget，这里只添加标签项
         widget.setObjectName(objectName)
-        self.OpacityAniStackedWidget.addWidget(widget)
         self.SegmentedWidget.addItem(routeKey=objectName, text=text)
\ No newline at end of file
@@ -1,5 +1,35 @@
+import os
+import codecs
+import shlex
+import shutil
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def _split(command):
+    """缓存命令字符串的拆分结果（返回元组，防止缓存被调用方修改）"""
+    return tuple(shlex.split(command))
+
+
+def _decode(data, encoding, errors):
+    """解码字节数据，errors 策略无法解码时改用 replace，不丢弃输出"""
+    if not data:
+        return ""
+    try:
+        return data.decode(encoding, errors=errors)
+    except UnicodeDecodeError:
+        return data.decode(encoding, errors="replace")
+
+
+def _truncate(data, limit):
+    """截断超出上限的输出"""
+    if data and limit is not None and len(data) > limit:
+        return data[:limit] + b"...[truncated]"
+    return data
+
+
 def execute_command(command, subprocess, timeout=30, encoding='utf-8', errors='ignore', 
-                    shell=False, input_data=None, environment=None):
+                    shell=False, input_data=None, environment=None, max_output=16*1024*1024):
     """
     执行系统命令，支持超时控制、自定义编码、环境变量等
     
@@ -12,43 +42,56 @@ def execute_command(command, subprocess, timeout=30, encoding='utf-8', errors='i
     shell        - 是否使用shell执行，默认False（推荐）
     input_data   - 输入到命令的数据（字符串或字节）
     environment  - 自定义环境变量（字典）
+    max_output   - stdout/stderr 各自保留的最大字节数，默认16MB，None为不限制
     
     返回:
     包含执行结果的字典
     """
-    # 定义安全的解码函数
-    def safe_decode(data, enc=encoding, err=errors):
-        """安全解码字节数据"""
-        if data is None:
-            return ""
-        try:
-            return data.decode(enc, errors=err)
-        except UnicodeDecodeError:
-            # 使用更宽松的错误处理策略
-            return data.decode(enc, errors="replace")
-        except Exception:
-            # 在无法解码的情况下返回原始数据
-            return str(data)
-
-    # 参数验证
-    if not isinstance(command, (list, tuple, str)):
+    # 参数验证（先按确切类型判断，子类等少见情况才退回 isinstance）
+    cmd_type = type(command)
+    if cmd_type is str:
+        is_str = True
+    elif cmd_type in (list, tuple):
+        is_str = False
+    elif isinstance(command, str):
+        is_str = True
+    elif isinstance(command, (list, tuple)):
+        is_str = False
+    else:
         return {
             "stdout": None,
             "stderr": "Error: command must be a string or list of strings",
             "returncode": -2
         }
     
+    # 提前校验编码和解码错误处理方式，无效名称直接报错
+    try:
+        codecs.lookup(encoding)
+        codecs.lookup_error(errors)
+    except (LookupError, TypeError) as e:
+        return {
+            "stdout": None,
+            "stderr": f"Error: invalid encoding or errors handler\nDetails: {str(e)}",
+            "returncode": -2
+        }
+    
     # 准备命令（如果是字符串且不使用shell，则需要拆分）
     use_shell = shell
-    if isinstance(command, str) and not shell:
+    if is_str and not shell:
         try:
             # 尝试智能分割命令字符串（避免复杂的shell语法）
-            import shlex
-            command = shlex.split(command)
+            command = _split(command)
+            is_str = False
         except Exception:
             # 如果无法分割，强制使用shell
             use_shell = True
     
+    # 命令名只计算一次，供后续检查和错误信息使用
+    if is_str:
+        cmd_name = command.partition(" ")[0]
+    else:
+        cmd_name = command[0] if command else ""
+    
     try:
         # 构建执行参数
         params = {
@@ -56,7 +99,6 @@ def execute_command(command, subprocess, timeout=30, encoding='utf-8', errors='i
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
             "text": False,  # 保持原始字节流，我们自己处理编码
-            "timeout": timeout,
             "shell": use_shell
         }
         
@@ -65,38 +107,59 @@ def execute_command(command, subprocess, timeout=30, encoding='utf-8', errors='i
             # 如果输入是字符串，转换为字节
             if isinstance(input_data, str):
                 input_data = input_data.encode(encoding)
-            params["input"] = input_data
+            params["stdin"] = subprocess.PIPE
         
         if environment is not None:
-            # 复制当前环境并更新
-            import os
-            env = os.environ.copy()
-            env.update(environment)
-            params["env"] = env
+            # 合并当前环境与自定义环境
+            params["env"] = {**os.environ, **dict(environment)}
+        
+        # 不使用shell且只给出命令名时，先在 PATH 中查找，找不到就不必创建进程
+        # （带路径的命令交给系统执行，以便区分“不存在”与“没有执行权限”）
+        if not use_shell and cmd_name and not os.path.dirname(cmd_name):
+            path = params["env"].get("PATH") if "env" in params else None
+            if shutil.which(cmd_name, path=path) is None:
+                return {
+                    "stdout": None,
+                    "stderr": f"Command not found: {cmd_name}\nError: executable not found in PATH",
+                    "returncode": -4
+                }
         
         # 执行命令
-        result = subprocess.run(**params)
+        with subprocess.Popen(**params) as process:
+            try:
+                out, err = process.communicate(input=input_data, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                out, err = process.communicate()
+                raise subprocess.TimeoutExpired(process.args, timeout,
+                                                output=_truncate(out, max_output),
+                                                stderr=_truncate(err, max_output))
+            except BaseException:
+                process.kill()
+                raise
+        out = _truncate(out, max_output)
+        err = _truncate(err, max_output)
         
         # 解码输出
-        stdout = safe_decode(result.stdout)
-        stderr = safe_decode(result.stderr)
+        stdout = _decode(out, encoding, errors)
+        stderr = _decode(err, encoding, errors)
         
         return {
             "stdout": stdout,
             "stderr": stderr,
-            "returncode": result.returncode
+            "returncode": process.returncode
         }
 
     except subprocess.CalledProcessError as e:
         return {
-            "stdout": safe_decode(e.stdout),
-            "stderr": safe_decode(e.stderr) if e.stderr is not None else str(e),
+            "stdout": _decode(e.stdout, encoding, errors),
+            "stderr": _decode(e.stderr, encoding, errors) if e.stderr is not None else str(e),
             "returncode": e.returncode
         }
     except subprocess.TimeoutExpired as e:
         # 特殊处理超时情况
-        stdout = safe_decode(e.stdout) if e.stdout is not None else ""
-        stderr = safe_decode(e.stderr) if e.stderr is not None else ""
+        stdout = _decode(e.stdout, encoding, errors)
+        stderr = _decode(e.stderr, encoding, errors)
         stderr += f"\nCommand timed out after {timeout} seconds"
         
         return {
@@ -106,14 +169,12 @@ def execute_command(command, subprocess, timeout=30, encoding='utf-8', errors='i
             "timeout": True
         }
     except FileNotFoundError as e:
-        cmd_name = command[0] if isinstance(command, list) else command.split()[0]
         return {
             "stdout": None,
             "stderr": f"Command not found: {cmd_name}\nError: {str(e)}",
             "returncode": -4
         }
     except PermissionError as e:
-        cmd_name = command[0] if isinstance(command, list) else command.split()[0]
         return {
             "stdout": None,
             "stderr": f"Permission denied for command: {cmd_name}\nError: {str(e)}",